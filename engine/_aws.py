@@ -0,0 +1,18 @@
+"""Shared lazy AWS client accessors.
+
+Client construction resolves credentials and endpoints (tens of
+milliseconds), so a single S3 client is created on first use and reused
+for the life of the process, including across warm Lambda invocations.
+"""
+
+import boto3
+
+_s3_client = None
+
+
+def get_s3():
+    """Get the shared S3 client, creating it on first use."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
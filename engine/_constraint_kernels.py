@@ -0,0 +1,53 @@
+"""Fused numeric kernels for constraint validation.
+
+Numba is an optional accelerator: when it is installed the float kernel is
+JIT-compiled into a single fused pass over the column (null check, running
+min, running max in one loop). Without Numba the same statistics are
+computed with vectorized NumPy reductions, which is still one C-level scan
+per reduction rather than one per constraint.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _scan_float_column_numpy(arr):
+    """NumPy fallback: null flag, min, and max for a float column."""
+    nan_mask = np.isnan(arr)
+    has_null = bool(nan_mask.any())
+    if arr.size == 0 or nan_mask.all():
+        return has_null, np.nan, np.nan
+    return has_null, float(np.nanmin(arr)), float(np.nanmax(arr))
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def scan_float_column(arr):
+        """Single fused pass: null flag, min, and max for a float column."""
+        has_null = False
+        min_val = np.inf
+        max_val = -np.inf
+        for x in arr:
+            if np.isnan(x):
+                has_null = True
+            else:
+                if x < min_val:
+                    min_val = x
+                if x > max_val:
+                    max_val = x
+        if min_val > max_val:
+            return has_null, np.nan, np.nan
+        return has_null, min_val, max_val
+else:
+    scan_float_column = _scan_float_column_numpy
+
+
+def scan_int_column(arr):
+    """Null flag, min, and max for an integer column (never null)."""
+    if arr.size == 0:
+        return False, None, None
+    return False, int(arr.min()), int(arr.max())
@@ -1,7 +1,30 @@
 """Contract parser module for reading and validating data contracts."""
 
+import os
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# Parsed contracts memoized per process, keyed by path with the entry
+# holding (fingerprint, contract). In Lambda the module survives across
+# warm invocations, so repeated calls for the same unchanged contract skip
+# the S3 download and YAML parse; a changed fingerprint overwrites the
+# entry, so the cache is bounded by the number of distinct contract paths.
+_CONTRACT_CACHE: Dict[str, Tuple[str, "DataContract"]] = {}
+
+# Contract schema types mapped to pandas dtypes. Nullable extension dtypes
+# are used for integers/booleans so columns with missing values still load
+# with their declared type instead of being upcast to float/object.
+_TYPE_TO_DTYPE = {
+    "integer": "Int64",
+    "float": "float64",
+    "string": "string",
+    "boolean": "boolean",
+}
+
+# Prefer the libyaml-backed loader when PyYAML was compiled against it;
+# it parses the same safe YAML subset 2.5-10x faster than the pure-Python
+# SafeLoader. Fall back transparently when libyaml is unavailable.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class DataContract:
@@ -34,38 +57,134 @@ class DataContract:
         """Get the transformations to apply."""
         return self.transformations
 
+    def get_dtype_map(self) -> Dict[str, str]:
+        """
+        Get a pandas dtype for each schema column with a recognized type.
+
+        Letting the CSV reader apply these up front keeps numeric columns
+        in typed arrays instead of falling back to object dtype, which makes
+        downstream null checks and aggregations much cheaper.
+
+        Returns:
+            Dictionary mapping column names to pandas dtype strings
+        """
+        dtype_map = {}
+        for col_name, col_spec in self.schema.get("columns", {}).items():
+            col_type = col_spec.get("type") if isinstance(col_spec, dict) else col_spec
+            dtype = _TYPE_TO_DTYPE.get(col_type)
+            if dtype is not None:
+                dtype_map[col_name] = dtype
+        return dtype_map
+
+
+def contract_fingerprint(contract_path: str) -> str:
+    """
+    Get a cheap change fingerprint for a contract file.
+
+    Uses the S3 ETag for S3 paths (a lightweight HEAD request) and the
+    modification time for local paths, so cached contracts are invalidated
+    whenever the underlying file changes.
+
+    Args:
+        contract_path: Path to the contract YAML file (local or S3)
+
+    Returns:
+        Fingerprint string for the current file contents
+    """
+    if contract_path.startswith("s3://"):
+        from engine._aws import get_s3
+        bucket, key = contract_path.replace("s3://", "").split("/", 1)
+        head = get_s3().head_object(Bucket=bucket, Key=key)
+        return head["ETag"]
+    return str(os.stat(contract_path).st_mtime_ns)
 
-def load_contract(contract_path: str) -> DataContract:
+
+def load_contract(contract_path: str, fingerprint: str = None) -> DataContract:
     """
     Load a data contract from a YAML file.
-    
+
     Args:
         contract_path: Path to the contract YAML file (local or S3)
-        
+        fingerprint: Optional precomputed change fingerprint from
+            contract_fingerprint, so callers that already fingerprinted
+            the path do not pay for a second stat/HEAD
+
     Returns:
         DataContract object
-        
+
     Raises:
         FileNotFoundError: If contract file not found
         ValueError: If contract format is invalid
     """
     try:
-        # Handle S3 paths
+        # Serve repeat loads of an unchanged contract from the in-process
+        # cache; the fingerprint check is far cheaper than a full download
+        # and parse on warm Lambda containers.
+        if fingerprint is None:
+            fingerprint = contract_fingerprint(contract_path)
+        cached = _CONTRACT_CACHE.get(contract_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        # Hand the loader a file-like object instead of reading everything
+        # into a string first; the YAML scanner consumes bytes incrementally
+        # and decodes UTF-8 itself, avoiding a full-size intermediate buffer.
         if contract_path.startswith("s3://"):
-            import boto3
-            s3_client = boto3.client("s3")
+            from engine._aws import get_s3
             bucket, key = contract_path.replace("s3://", "").split("/", 1)
-            obj = s3_client.get_object(Bucket=bucket, Key=key)
-            content = obj["Body"].read().decode("utf-8")
+            obj = get_s3().get_object(Bucket=bucket, Key=key)
+            contract_dict = yaml.load(obj["Body"], Loader=_Loader)
         else:
-            with open(contract_path, "r") as f:
-                content = f.read()
-        
-        # Parse YAML
-        contract_dict = yaml.safe_load(content)
-        return DataContract(contract_dict)
-    
+            with open(contract_path, "rb") as f:
+                contract_dict = yaml.load(f, Loader=_Loader)
+
+        contract = DataContract(contract_dict)
+        _CONTRACT_CACHE[contract_path] = (fingerprint, contract)
+        return contract
+
     except FileNotFoundError:
         raise FileNotFoundError(f"Contract file not found: {contract_path}")
     except Exception as e:
         raise ValueError(f"Failed to load contract: {str(e)}")
+
+
+def load_contract_header(contract_path: str, max_bytes: int = 4096) -> DataContract:
+    """
+    Load only the leading bytes of a contract for routing metadata.
+
+    Useful when probing several contracts for top-level keys such as
+    ``name`` and ``version``: only the first ``max_bytes`` are fetched
+    (a ranged GET for S3), so large contracts are not downloaded and
+    parsed in full just to read their header.
+
+    Args:
+        contract_path: Path to the contract YAML file (local or S3)
+        max_bytes: Number of leading bytes to fetch and parse
+
+    Returns:
+        DataContract object; fields beyond the fetched slice may be empty
+
+    Raises:
+        FileNotFoundError: If contract file not found
+        ValueError: If contract format is invalid
+    """
+    try:
+        if contract_path.startswith("s3://"):
+            from engine._aws import get_s3
+            bucket, key = contract_path.replace("s3://", "").split("/", 1)
+            obj = get_s3().get_object(
+                Bucket=bucket, Key=key, Range=f"bytes=0-{max_bytes - 1}"
+            )
+            head = obj["Body"].read()
+        else:
+            with open(contract_path, "rb") as f:
+                head = f.read(max_bytes)
+
+        return DataContract(yaml.load(head, Loader=_Loader))
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Contract file not found: {contract_path}")
+    except Exception:
+        # The slice can end mid-token for larger contracts; fall back to a
+        # full parse in that case
+        return load_contract(contract_path)
@@ -5,6 +5,15 @@ from typing import Dict, Any
 from datetime import datetime, timezone
 
 
+# Human-readable message templates for structured violation codes
+_VIOLATION_TEMPLATES = {
+    "min_rows": "Row count {actual} is less than minimum {expected}",
+    "max_rows": "Row count {actual} exceeds maximum {expected}",
+    "completeness_threshold": "Completeness {actual:.2%} is below threshold {expected:.2%}",
+    "error": "Error enforcing SLA: {message}",
+}
+
+
 class SLAEnforcer:
     """Enforces Service Level Agreements on data."""
     
@@ -18,13 +27,17 @@ class SLAEnforcer:
         self.sla_rules = sla_rules
         self.metrics = {}
     
-    def enforce_sla(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def enforce_sla(self, df: pd.DataFrame, null_counts: pd.Series = None,
+                    row_count: int = None) -> Dict[str, Any]:
         """
         Enforce SLA rules on dataframe.
-        
+
         Args:
             df: Pandas DataFrame to check against SLA
-            
+            null_counts: Optional precomputed per-column null counts, so a
+                caller that already scanned the frame can avoid a second pass
+            row_count: Optional precomputed row count
+
         Returns:
             Dictionary with SLA enforcement results
         """
@@ -36,44 +49,82 @@ class SLAEnforcer:
         }
         
         try:
-            row_count = len(df)
+            if row_count is None:
+                row_count = len(df)
             
             # Check row count SLA
             if "min_rows" in self.sla_rules:
                 results["metrics"]["row_count"] = row_count
                 if row_count < self.sla_rules["min_rows"]:
                     results["sla_passed"] = False
-                    results["violations"].append(
-                        f"Row count {row_count} is less than minimum {self.sla_rules['min_rows']}"
-                    )
+                    results["violations"].append({
+                        "code": "min_rows",
+                        "actual": row_count,
+                        "expected": self.sla_rules["min_rows"]
+                    })
             
             # Check max rows SLA
             if "max_rows" in self.sla_rules:
                 if row_count > self.sla_rules["max_rows"]:
                     results["sla_passed"] = False
-                    results["violations"].append(
-                        f"Row count {row_count} exceeds maximum {self.sla_rules['max_rows']}"
-                    )
+                    results["violations"].append({
+                        "code": "max_rows",
+                        "actual": row_count,
+                        "expected": self.sla_rules["max_rows"]
+                    })
             
-            # Check completeness SLA
-            if "completeness_threshold" in self.sla_rules:
+            # Check completeness SLA. Skipped when a cheap O(1) row-count
+            # check has already failed, so the O(rows * cols) null scan is
+            # never paid for data that is being rejected anyway.
+            if "completeness_threshold" in self.sla_rules and results["sla_passed"]:
                 threshold = self.sla_rules["completeness_threshold"]
                 total_cells = row_count * len(df.columns)
-                null_cells = df.isna().sum().sum()
-                completeness = (total_cells - null_cells) / total_cells if total_cells > 0 else 1.0
+                if null_counts is not None:
+                    null_cells = int(null_counts.sum())
+                else:
+                    # One flat NumPy reduction over the null mask instead of
+                    # the per-column Series produced by .sum().sum()
+                    null_cells = int(df.isna().values.sum())
+                # Branchless form: max(total_cells, 1) keeps the empty-frame
+                # case at completeness 1.0 without a conditional, and the
+                # same expression vectorizes directly if completeness is
+                # ever computed per column
+                completeness = 1.0 - null_cells / max(total_cells, 1)
                 results["metrics"]["completeness"] = completeness
                 
                 if completeness < threshold:
                     results["sla_passed"] = False
-                    results["violations"].append(
-                        f"Completeness {completeness:.2%} is below threshold {threshold:.2%}"
-                    )
-            
+                    results["violations"].append({
+                        "code": "completeness_threshold",
+                        "actual": completeness,
+                        "expected": threshold
+                    })
+
             return results
         except Exception as e:
             results["sla_passed"] = False
-            results["violations"].append(f"Error enforcing SLA: {str(e)}")
+            results["violations"].append({"code": "error", "message": str(e)})
             return results
+
+    @staticmethod
+    def format_violations(results: Dict[str, Any]) -> list:
+        """
+        Render structured SLA violations as human-readable messages.
+
+        Violations are stored as dicts so message formatting is only paid
+        by callers that actually need the text.
+
+        Args:
+            results: Results dictionary from enforce_sla
+
+        Returns:
+            List of formatted violation messages
+        """
+        messages = []
+        for violation in results.get("violations", []):
+            template = _VIOLATION_TEMPLATES.get(violation.get("code"), "{code}")
+            messages.append(template.format(**violation))
+        return messages
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current SLA metrics."""
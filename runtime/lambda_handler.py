@@ -2,21 +2,34 @@
 
 import json
 import logging
-import boto3
 import pandas as pd
 from typing import Dict, Any
-from io import StringIO
+from io import BytesIO
 import os
+import tempfile
 
-from engine.contract_parser import load_contract
+from engine._aws import get_s3
+from engine.contract_parser import contract_fingerprint, load_contract
 from engine.pipeline_generator import PipelineGenerator
 
 # Setup logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# S3 client
-s3_client = boto3.client("s3")
+# Pipelines cached per contract path with the contract's change
+# fingerprint, so warm invocations reuse the already-built validation
+# engines (compiled column sets, SLA thresholds) instead of rebuilding
+# them on every request
+_PIPELINE_CACHE: Dict[str, tuple] = {}
+
+# Use the PyArrow CSV reader when it is installed: it parses multi-threaded
+# and returns Arrow-backed columns that are cheaper for the downstream
+# null/aggregation checks. Falls back to the default C engine otherwise.
+try:
+    import pyarrow  # noqa: F401
+    _CSV_READ_KWARGS = {"engine": "pyarrow", "dtype_backend": "pyarrow"}
+except ImportError:
+    _CSV_READ_KWARGS = {}
 
 
 def _is_s3_path(path: str) -> bool:
@@ -24,12 +37,69 @@ def _is_s3_path(path: str) -> bool:
     return path.startswith("s3://")
 
 
-def _read_csv(path: str) -> pd.DataFrame:
-    """Read CSV file from S3 or local filesystem."""
+def _is_parquet_path(path: str) -> bool:
+    """Check if path points at a Parquet file by extension."""
+    return path.endswith((".parquet", ".pq"))
+
+
+def _read(path: str, dtype_map: Dict[str, str] = None) -> pd.DataFrame:
+    """Read a data file from S3 or local filesystem, dispatching on format.
+
+    Parquet is preferred when the extension asks for it: the columnar
+    binary encoding is much faster to parse than CSV and already typed.
+    """
+    if _is_parquet_path(path):
+        return _read_parquet(path)
+    return _read_csv(path, dtype_map)
+
+
+def _write(df: pd.DataFrame, path: str) -> None:
+    """Write a data file to S3 or local filesystem, dispatching on format."""
+    if _is_parquet_path(path):
+        _write_parquet(df, path)
+    else:
+        _write_csv(df, path)
+
+
+def _read_parquet(path: str) -> pd.DataFrame:
+    """Read Parquet file from S3 or local filesystem (requires pyarrow)."""
+    if _is_s3_path(path):
+        bucket, key = path.replace("s3://", "").split("/", 1)
+        obj = get_s3().get_object(Bucket=bucket, Key=key)
+        return pd.read_parquet(BytesIO(obj["Body"].read()), engine="pyarrow")
+    return pd.read_parquet(path, engine="pyarrow")
+
+
+def _write_parquet(df: pd.DataFrame, path: str) -> None:
+    """Write Parquet file to S3 or local filesystem (requires pyarrow)."""
     if _is_s3_path(path):
-        return _read_csv_from_s3(path)
+        bucket, key = path.replace("s3://", "").split("/", 1)
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES, mode="w+b") as buf:
+            df.to_parquet(buf, engine="pyarrow", compression="snappy")
+            buf.seek(0)
+            get_s3().upload_fileobj(buf, bucket, key)
     else:
-        return pd.read_csv(path)
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        df.to_parquet(path, engine="pyarrow", compression="snappy")
+
+
+def _read_csv(path: str, dtype_map: Dict[str, str] = None) -> pd.DataFrame:
+    """Read CSV file from S3 or local filesystem."""
+    if _is_s3_path(path):
+        return _read_csv_from_s3(path, dtype_map)
+    if dtype_map:
+        try:
+            return pd.read_csv(path, dtype=dtype_map, **_CSV_READ_KWARGS)
+        except (ValueError, TypeError) as e:
+            # Data that does not match the contract types must surface as a
+            # validation failure downstream, not a parse crash here
+            logger.warning(
+                f"Contract dtypes could not be applied to {path} ({e}); "
+                "re-reading with inferred types"
+            )
+    return pd.read_csv(path, **_CSV_READ_KWARGS)
 
 
 def _write_csv(df: pd.DataFrame, path: str) -> None:
@@ -48,27 +118,62 @@ def _read_contract(path: str) -> str:
     """Read contract file from S3 or local filesystem."""
     if _is_s3_path(path):
         bucket, key = path.replace("s3://", "").split("/", 1)
-        obj = s3_client.get_object(Bucket=bucket, Key=key)
+        obj = get_s3().get_object(Bucket=bucket, Key=key)
         return obj["Body"].read().decode("utf-8")
     else:
         with open(path, "r") as f:
             return f.read()
 
 
-def _read_csv_from_s3(s3_path: str) -> pd.DataFrame:
+def _read_csv_from_s3(s3_path: str, dtype_map: Dict[str, str] = None) -> pd.DataFrame:
     """Read CSV file from S3 path."""
     bucket, key = s3_path.replace("s3://", "").split("/", 1)
-    obj = s3_client.get_object(Bucket=bucket, Key=key)
-    df = pd.read_csv(obj["Body"])
+    obj = get_s3().get_object(Bucket=bucket, Key=key)
+    body = obj["Body"]
+    if _CSV_READ_KWARGS or dtype_map:
+        # The PyArrow engine needs a seekable buffer rather than a
+        # streaming body, and so does the dtype-fallback retry below
+        body = BytesIO(body.read())
+    if dtype_map:
+        try:
+            return pd.read_csv(body, dtype=dtype_map, **_CSV_READ_KWARGS)
+        except (ValueError, TypeError) as e:
+            # Data that does not match the contract types must surface as a
+            # validation failure downstream, not a parse crash here
+            logger.warning(
+                f"Contract dtypes could not be applied to {s3_path} ({e}); "
+                "re-reading with inferred types"
+            )
+            body.seek(0)
+    df = pd.read_csv(body, **_CSV_READ_KWARGS)
     return df
 
 
+# Outputs up to this size are serialized in memory; larger ones spill to
+# disk so Lambda memory stays bounded regardless of output size
+_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
+
 def _write_csv_to_s3(df: pd.DataFrame, s3_path: str) -> None:
     """Write CSV file to S3 path."""
     bucket, key = s3_path.replace("s3://", "").split("/", 1)
-    csv_buffer = StringIO()
-    df.to_csv(csv_buffer, index=False)
-    s3_client.put_object(Bucket=bucket, Key=key, Body=csv_buffer.getvalue())
+    # upload_fileobj streams the buffer in chunks (multipart for large
+    # files) instead of holding one full copy of the CSV for put_object
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES, mode="w+b") as buf:
+        df.to_csv(buf, index=False)
+        buf.seek(0)
+        get_s3().upload_fileobj(buf, bucket, key)
+
+
+def _get_pipeline(contract_path: str, contract, fingerprint: str) -> PipelineGenerator:
+    """Get a pipeline for the contract, reusing a cached one if unchanged."""
+    cached = _PIPELINE_CACHE.get(contract_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    pipeline = PipelineGenerator(contract)
+    _PIPELINE_CACHE[contract_path] = (fingerprint, pipeline)
+    return pipeline
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -113,9 +218,14 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         logger.info(f"Processing contract: {contract_path}")
         
+        # Fingerprint the contract once per invocation; the contract cache
+        # and the pipeline cache both key off the same value, so S3
+        # contracts cost a single HEAD request here
+        fingerprint = contract_fingerprint(contract_path)
+
         # Load contract (direct YAML reading since contract_parser uses load_contract)
         logger.info("Loading contract...")
-        contract = load_contract(contract_path)
+        contract = load_contract(contract_path, fingerprint=fingerprint)
         logger.info(f"Contract loaded: {contract.name} v{contract.version}")
         
         # Get source and target paths (from event override or contract)
@@ -128,15 +238,16 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         logger.info(f"Source path: {source_path}")
         logger.info(f"Target path: {target_path}")
         
-        # Read input data (supports both S3 and local)
+        # Read input data (supports both S3 and local), applying the
+        # contract's declared column types at parse time
         logger.info("Reading input data...")
-        df = _read_csv(source_path)
+        df = _read(source_path, contract.get_dtype_map())
         input_row_count = len(df)
         logger.info(f"Input data loaded: {input_row_count} rows")
         
         # Generate and execute pipeline
         logger.info("Generating and executing pipeline...")
-        pipeline = PipelineGenerator(contract)
+        pipeline = _get_pipeline(contract_path, contract, fingerprint)
         pipeline_results = pipeline.generate(df)
         
         logger.info(f"Pipeline execution results: {json.dumps(pipeline_results, indent=2, default=str)}")
@@ -152,7 +263,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         # Write output data (supports both S3 and local)
         logger.info("Writing output data...")
-        _write_csv(df, target_path)
+        _write(df, target_path)
         logger.info(f"Output data written: {len(df)} rows")
         
         # Return success
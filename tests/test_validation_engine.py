@@ -1,93 +1,188 @@
 """Unit tests for validation engine module."""
 
+import numpy as np
 import pytest
 import pandas as pd
+from types import MappingProxyType
 from engine.validation_engine import ValidationEngine
 
+# The sample schema is a constant, so it is declared once at module scope
+# as a read-only mapping instead of being rebuilt per test; the fixture
+# hands out an identity-stable reference
+_SAMPLE_SCHEMA = MappingProxyType({
+    "columns": MappingProxyType({
+        "id": "integer",
+        "name": "string",
+        "email": "string"
+    })
+})
+
 
-@pytest.fixture
+# Fixtures are session-scoped so each frame is built once and shared by
+# every test that reads it; none of the tests mutate their input. Dtypes
+# are explicit so columns land in typed arrays (nullable Int64/string)
+# instead of going through inference and object-dtype storage.
+
+@pytest.fixture(scope="session")
 def sample_schema():
     """Sample schema for testing."""
-    return {
-        "columns": {
-            "id": "integer",
-            "name": "string",
-            "email": "string"
-        }
-    }
+    return _SAMPLE_SCHEMA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataframe():
     """Sample DataFrame for testing."""
     return pd.DataFrame({
-        "id": [1, 2, 3],
-        "name": ["John", "Jane", "Bob"],
-        "email": ["john@example.com", "jane@example.com", "bob@example.com"]
+        "id": pd.array([1, 2, 3], dtype="int64"),
+        "name": pd.array(["John", "Jane", "Bob"], dtype="string"),
+        "email": pd.array(
+            ["john@example.com", "jane@example.com", "bob@example.com"],
+            dtype="string"
+        )
+    })
+
+
+@pytest.fixture(scope="session")
+def quality_dataframe():
+    """DataFrame with one null id for data quality tests."""
+    return pd.DataFrame({
+        "id": pd.array([1, 2, None], dtype="Int64"),
+        "name": pd.array(["John", "Jane", "Bob"], dtype="string")
+    })
+
+
+@pytest.fixture(scope="session")
+def null_name_dataframe():
+    """DataFrame with a null name for not_null constraint tests."""
+    return pd.DataFrame({
+        "id": pd.array([1, 2], dtype="int64"),
+        "name": pd.array(["John", None], dtype="string")
+    })
+
+
+@pytest.fixture(scope="session")
+def engine(sample_schema):
+    """Engine built once for the session-wide sample schema."""
+    return ValidationEngine(sample_schema)
+
+
+@pytest.fixture(scope="session")
+def constraint_engine():
+    """Schema-less engine shared by the constraint test cases."""
+    return ValidationEngine({})
+
+
+@pytest.fixture(scope="session")
+def age_dataframe():
+    """Numeric DataFrame for value constraint tests."""
+    return pd.DataFrame({
+        "age": pd.array([18, 25, 30], dtype="int64")
     })
 
 
 class TestValidationEngine:
     """Test ValidationEngine class."""
     
-    def test_validation_engine_initialization(self, sample_schema):
+    def test_validation_engine_initialization(self, engine, sample_schema):
         """Test ValidationEngine initialization."""
-        engine = ValidationEngine(sample_schema)
         assert engine.schema == sample_schema
-    
-    def test_validate_schema_valid(self, sample_schema, sample_dataframe):
+
+    def test_validate_schema_valid(self, engine, sample_dataframe):
         """Test schema validation with valid schema."""
-        engine = ValidationEngine(sample_schema)
         assert engine.validate_schema(sample_dataframe) is True
-    
-    def test_validate_schema_invalid(self, sample_schema):
+
+    def test_validate_schema_invalid(self, engine):
         """Test schema validation with invalid schema."""
-        engine = ValidationEngine(sample_schema)
-        
         # DataFrame missing required column
         df = pd.DataFrame({
             "id": [1, 2],
             "name": ["John", "Jane"]
         })
-        
+
         assert engine.validate_schema(df) is False
-    
-    def test_validate_data_quality(self):
+
+    def test_validate_data_quality(self, constraint_engine, quality_dataframe):
         """Test data quality validation."""
-        engine = ValidationEngine({})
-        
-        df = pd.DataFrame({
-            "id": [1, 2, None],
-            "name": ["John", "Jane", "Bob"]
-        })
-        
-        results = engine.validate_data_quality(df)
+        results = constraint_engine.validate_data_quality(quality_dataframe)
         assert results["total_rows"] == 3
         assert results["null_counts"]["id"] == 1
         assert results["null_counts"]["name"] == 0
-    
-    def test_validate_constraints_not_null(self):
+
+    @pytest.mark.parametrize("column,expected", [("id", True), ("name", False)])
+    def test_validate_constraints_not_null(self, constraint_engine, null_name_dataframe,
+                                           column, expected):
         """Test not_null constraint validation."""
-        engine = ValidationEngine({})
-        
-        df = pd.DataFrame({
-            "id": [1, 2],
-            "name": ["John", None]
-        })
-        
-        constraints = [{"type": "not_null", "column": "name"}]
-        assert engine.validate_constraints(df, constraints) is False
-    
-    def test_validate_constraints_min_value(self):
+        constraints = [{"type": "not_null", "column": column}]
+        assert constraint_engine.validate_constraints(null_name_dataframe, constraints) is expected
+
+    @pytest.mark.parametrize("value,expected", [(18, True), (20, False)])
+    def test_validate_constraints_min_value(self, constraint_engine, age_dataframe,
+                                            value, expected):
         """Test min_value constraint validation."""
-        engine = ValidationEngine({})
-        
+        constraints = [{"type": "min_value", "column": "age", "value": value}]
+        assert constraint_engine.validate_constraints(age_dataframe, constraints) is expected
+
+    def test_validate_data_quality_arrow_table(self, constraint_engine):
+        """Test data quality validation on an Arrow table input."""
+        pa = pytest.importorskip("pyarrow")
+
+        table = pa.table({
+            "id": pa.array([1, 2, None], pa.int64()),
+            "name": pa.array(["John", "Jane", "Bob"], pa.string())
+        })
+
+        results = constraint_engine.validate_data_quality(table)
+        assert results["total_rows"] == 3
+        assert results["null_counts"]["id"] == 1
+
+    @pytest.mark.parametrize("column,expected", [("id", True), ("name", False)])
+    def test_validate_constraints_not_null_arrow(self, constraint_engine, column, expected):
+        """Test not_null on Arrow-backed columns (O(1) null-count path)."""
+        pa = pytest.importorskip("pyarrow")
+
         df = pd.DataFrame({
-            "age": [18, 25, 30]
+            "id": pd.array([1, 2], dtype=pd.ArrowDtype(pa.int64())),
+            "name": pd.array(["John", None], dtype=pd.ArrowDtype(pa.string()))
         })
-        
+
+        constraints = [{"type": "not_null", "column": column}]
+        assert constraint_engine.validate_constraints(df, constraints) is expected
+
+    @pytest.mark.parametrize("n", [3, 1_000_000])
+    def test_validate_constraints_min_value_scales(self, constraint_engine, n):
+        """Test min_value on large columns to exercise the vectorized path.
+
+        A regression to a per-element Python loop would show up immediately
+        in the million-row case under ``pytest --durations``.
+        """
+        df = pd.DataFrame({"age": np.arange(18, 18 + n, dtype=np.int64)})
+
         constraints = [{"type": "min_value", "column": "age", "value": 18}]
-        assert engine.validate_constraints(df, constraints) is True
-        
-        constraints = [{"type": "min_value", "column": "age", "value": 20}]
-        assert engine.validate_constraints(df, constraints) is False
+        assert constraint_engine.validate_constraints(df, constraints) is True
+
+        constraints = [{"type": "min_value", "column": "age", "value": 19}]
+        assert constraint_engine.validate_constraints(df, constraints) is False
+
+    def test_constraints_no_nullcheck_avoids_isna(self, constraint_engine, monkeypatch):
+        """Test that no null scan runs without a not_null constraint."""
+        df = pd.DataFrame({"name": pd.array(["alice", "bob"], dtype="string")})
+
+        def _fail_isna(*args, **kwargs):
+            raise AssertionError("isna should not be called")
+
+        monkeypatch.setattr(pd.Series, "isna", _fail_isna)
+
+        constraints = [{"type": "min_value", "column": "name", "value": "a"}]
+        assert constraint_engine.validate_constraints(df, constraints) is True
+
+    def test_validate_constraints_multiple_on_column(self, constraint_engine, age_dataframe):
+        """Test several constraints on one column evaluated in a single scan."""
+        constraints = [
+            {"type": "not_null", "column": "age"},
+            {"type": "min_value", "column": "age", "value": 18},
+            {"type": "max_value", "column": "age", "value": 30}
+        ]
+        assert constraint_engine.validate_constraints(age_dataframe, constraints) is True
+
+        constraints.append({"type": "max_value", "column": "age", "value": 29})
+        assert constraint_engine.validate_constraints(age_dataframe, constraints) is False